@@ -19,6 +19,15 @@ ONE_ATTENTION_INTERACTION_THRESHOLD = 5
 TWO_ATTENTION_INTERACTION_THRESHOLD = 10
 ALL_LABEL_PHRASES = {"all", "all areas", "all labels", "all-areas", "all-labels", "*"}
 
+# Compiled once; compact_text and clean_title_for_description run per issue
+# and per comment while building the digest.
+WHITESPACE_RE = re.compile(r"\s+")
+TITLE_PRODUCT_PREFIX_RE = re.compile(
+    r"^(codex(?: desktop| app|\.app| cli)?|desktop|windows codex app)\s*[:,-]\s*",
+    re.IGNORECASE,
+)
+TITLE_ON_WINDOWS_RE = re.compile(r"^on windows,\s*", re.IGNORECASE)
+
 
 class GhCommandError(RuntimeError):
     pass
@@ -497,7 +506,7 @@ def reaction_event_summary(reactions, since, until):
 
 
 def compact_text(value, limit):
-    text = re.sub(r"\s+", " ", str(value or "")).strip()
+    text = WHITESPACE_RE.sub(" ", str(value or "")).strip()
     if limit <= 0:
         return ""
     if len(text) <= limit:
@@ -506,14 +515,9 @@ def compact_text(value, limit):
 
 
 def clean_title_for_description(title):
-    cleaned = re.sub(r"\s+", " ", str(title or "")).strip()
-    cleaned = re.sub(
-        r"^(codex(?: desktop| app|\.app| cli)?|desktop|windows codex app)\s*[:,-]\s*",
-        "",
-        cleaned,
-        flags=re.IGNORECASE,
-    )
-    cleaned = re.sub(r"^on windows,\s*", "Windows: ", cleaned, flags=re.IGNORECASE)
+    cleaned = WHITESPACE_RE.sub(" ", str(title or "")).strip()
+    cleaned = TITLE_PRODUCT_PREFIX_RE.sub("", cleaned)
+    cleaned = TITLE_ON_WINDOWS_RE.sub("Windows: ", cleaned)
     cleaned = cleaned.strip(" -:;")
     return compact_text(cleaned, 80) or "Issue needs owner review"
 
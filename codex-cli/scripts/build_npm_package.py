@@ -2,6 +2,7 @@
 """Stage and optionally package the @openai/codex npm module."""
 
 import argparse
+import errno
 import json
 import os
 import shutil
@@ -147,83 +148,82 @@ def main() -> int:
     if not version:
         raise RuntimeError("Must specify --version or --release-version.")
 
-    staging_dir, created_temp = prepare_staging_dir(args.staging_dir)
+    staging_dir = prepare_staging_dir(args.staging_dir)
 
-    try:
-        stage_sources(staging_dir, version, package)
+    stage_sources(staging_dir, version, package)
 
-        vendor_src = args.vendor_src.resolve() if args.vendor_src else None
-        native_components = PACKAGE_NATIVE_COMPONENTS.get(package, [])
-        target_filter = PACKAGE_TARGET_FILTERS.get(package)
+    vendor_src = args.vendor_src.resolve() if args.vendor_src else None
+    native_components = PACKAGE_NATIVE_COMPONENTS.get(package, [])
+    target_filter = PACKAGE_TARGET_FILTERS.get(package)
 
-        if native_components:
-            if vendor_src is None:
-                components_str = ", ".join(native_components)
-                raise RuntimeError(
-                    "Native components "
-                    f"({components_str}) required for package '{package}'. Provide --vendor-src "
-                    "pointing to a directory containing pre-installed binaries."
-                )
-
-            copy_native_binaries(
-                vendor_src,
-                staging_dir,
-                native_components,
-                target_filter={target_filter} if target_filter else None,
+    if native_components:
+        if vendor_src is None:
+            components_str = ", ".join(native_components)
+            raise RuntimeError(
+                "Native components "
+                f"({components_str}) required for package '{package}'. Provide --vendor-src "
+                "pointing to a directory containing pre-installed binaries."
             )
 
-        if release_version:
-            staging_dir_str = str(staging_dir)
-            if package == "codex":
-                print(
-                    f"Staged version {version} for release in {staging_dir_str}\n\n"
-                    "Verify the CLI:\n"
-                    f"    node {staging_dir_str}/bin/codex.js --version\n"
-                    f"    node {staging_dir_str}/bin/codex.js --help\n\n"
-                )
-            elif package == "codex-responses-api-proxy":
-                print(
-                    f"Staged version {version} for release in {staging_dir_str}\n\n"
-                    "Verify the responses API proxy:\n"
-                    f"    node {staging_dir_str}/bin/codex-responses-api-proxy.js --help\n\n"
-                )
-            elif package in CODEX_PLATFORM_PACKAGES:
-                print(
-                    f"Staged version {version} for release in {staging_dir_str}\n\n"
-                    "Verify native payload contents:\n"
-                    f"    ls {staging_dir_str}/vendor\n\n"
-                )
-            else:
-                print(
-                    f"Staged version {version} for release in {staging_dir_str}\n\n"
-                    "Verify the SDK contents:\n"
-                    f"    ls {staging_dir_str}/dist\n"
-                    "    node -e \"import('./dist/index.js').then(() => console.log('ok'))\"\n\n"
-                )
+        copy_native_binaries(
+            vendor_src,
+            staging_dir,
+            native_components,
+            target_filter={target_filter} if target_filter else None,
+        )
+
+    if release_version:
+        staging_dir_str = str(staging_dir)
+        if package == "codex":
+            print(
+                f"Staged version {version} for release in {staging_dir_str}\n\n"
+                "Verify the CLI:\n"
+                f"    node {staging_dir_str}/bin/codex.js --version\n"
+                f"    node {staging_dir_str}/bin/codex.js --help\n\n"
+            )
+        elif package == "codex-responses-api-proxy":
+            print(
+                f"Staged version {version} for release in {staging_dir_str}\n\n"
+                "Verify the responses API proxy:\n"
+                f"    node {staging_dir_str}/bin/codex-responses-api-proxy.js --help\n\n"
+            )
+        elif package in CODEX_PLATFORM_PACKAGES:
+            print(
+                f"Staged version {version} for release in {staging_dir_str}\n\n"
+                "Verify native payload contents:\n"
+                f"    ls {staging_dir_str}/vendor\n\n"
+            )
         else:
-            print(f"Staged package in {staging_dir}")
+            print(
+                f"Staged version {version} for release in {staging_dir_str}\n\n"
+                "Verify the SDK contents:\n"
+                f"    ls {staging_dir_str}/dist\n"
+                "    node -e \"import('./dist/index.js').then(() => console.log('ok'))\"\n\n"
+            )
+    else:
+        print(f"Staged package in {staging_dir}")
 
-        if args.pack_output is not None:
-            output_path = run_npm_pack(staging_dir, args.pack_output)
-            print(f"npm pack output written to {output_path}")
-    finally:
-        if created_temp:
-            # Preserve the staging directory for further inspection.
-            pass
+    if args.pack_output is not None:
+        output_path = run_npm_pack(staging_dir, args.pack_output)
+        print(f"npm pack output written to {output_path}")
 
     return 0
 
 
-def prepare_staging_dir(staging_dir: Path | None) -> tuple[Path, bool]:
+def prepare_staging_dir(staging_dir: Path | None) -> Path:
     if staging_dir is not None:
         staging_dir = staging_dir.resolve()
         staging_dir.mkdir(parents=True, exist_ok=True)
-        if any(staging_dir.iterdir()):
-            raise RuntimeError(f"Staging directory {staging_dir} is not empty.")
-        return staging_dir, False
+        # os.scandir stops at the first entry; Path.iterdir would build a Path
+        # object for every sibling just to test emptiness.
+        with os.scandir(staging_dir) as entries:
+            if next(entries, None) is not None:
+                raise RuntimeError(f"Staging directory {staging_dir} is not empty.")
+        return staging_dir
 
-    temp_dir = Path(tempfile.mkdtemp(prefix="codex-npm-stage-"))
-    return temp_dir, True
+    # Temporary staging directories are intentionally preserved so the staged
+    # package can be inspected after the script exits.
+    return Path(tempfile.mkdtemp(prefix="codex-npm-stage-"))
 
 
 def stage_sources(staging_dir: Path, version: str, package: str) -> None:
@@ -442,7 +442,15 @@ def run_npm_pack(staging_dir: Path, output_path: Path) -> Path:
         if not tarball_path.exists():
             raise RuntimeError(f"Expected npm pack output not found: {tarball_path}")
 
-        shutil.move(str(tarball_path), output_path)
+        # Prefer an atomic rename; fall back to a copy when the pack dir and
+        # the destination live on different filesystems.
+        try:
+            os.replace(tarball_path, output_path)
+        except OSError as exc:
+            if exc.errno != errno.EXDEV:
+                raise
+            shutil.copy2(tarball_path, output_path)
+            tarball_path.unlink()
 
     return output_path
 
@@ -964,10 +964,15 @@ def main(argv: Sequence[str] | None = None) -> int:
     if report_path_value:
         report_path = Path(report_path_value)
         report_path.parent.mkdir(parents=True, exist_ok=True)
-        report_path.write_text(
+        # The compliance harness polls for this file while the adapter may
+        # still be running; publish via rename so it never observes a
+        # partially written report.
+        tmp_path = report_path.with_name(report_path.name + ".tmp")
+        tmp_path.write_text(
             json.dumps(report, ensure_ascii=False, indent=2, sort_keys=True) + "\n",
             encoding="utf-8",
         )
+        os.replace(tmp_path, report_path)
     print(json.dumps(report, ensure_ascii=False, sort_keys=True))
     return 0 if report.get("success") is True else 1
 
@@ -450,8 +450,12 @@ def _run_scenario(
     # group.
     if returncode != 0 and not adapter_report.is_file():
         report_deadline = time.monotonic() + min(process_grace_seconds, 10)
+        # Back off exponentially: respond within ~1ms when the report lands
+        # right away without waking 20 times a second for the full grace period.
+        poll_delay = 0.001
         while time.monotonic() < report_deadline and not adapter_report.is_file():
-            time.sleep(0.05)
+            time.sleep(poll_delay)
+            poll_delay = min(poll_delay * 2, 0.05)
     if returncode != 0 and process is not None:
         _terminate_process_group(process)
 
@@ -1218,7 +1218,9 @@ def main(argv: Sequence[str] | None = None) -> int:
     if args.baseline_report is not None:
         baseline_path = args.baseline_report.expanduser().resolve()
         try:
-            loaded_baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+            # json.loads handles UTF-8 (and BOM) bytes directly; skipping the
+            # Python-level decode matters for multi-MB baseline files.
+            loaded_baseline = json.loads(baseline_path.read_bytes())
         except (OSError, UnicodeError, json.JSONDecodeError) as exc:
             print(
                 f"error: cannot read reviewer baseline {baseline_path}: {exc}",
@@ -72,6 +72,10 @@ REQUIRED_REGRESSION_MODES = (
 )
 TEST_SERVER_NAME = "mcp_spec_fixture"
 TEST_META_KEY = "com.openai/mcp-spec-test"
+
+# json.dumps builds a fresh JSONEncoder whenever non-default options are
+# passed; reuse one encoder for the JSONL write path.
+_JSONL_ENCODE = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
 CHECK_ORDER = (
     "mcp_add",
     "mcp_get",
@@ -180,11 +184,12 @@ class AppServerClient:
             [str(codex_binary), "app-server"],
             cwd=cwd,
             env=dict(env),
+            # Block-buffered binary pipes: json handles UTF-8 bytes directly,
+            # so large JSONL payloads skip the text-wrapper decode and the
+            # per-line flushes that line buffering would force.
             stdin=subprocess.PIPE,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
-            text=True,
-            bufsize=1,
         )
         self._stdout_thread = threading.Thread(
             target=self._read_stdout,
@@ -213,8 +218,8 @@ class AppServerClient:
                 continue
             try:
                 message = json.loads(stripped)
-            except json.JSONDecodeError:
-                self._parse_errors.append(stripped[:500])
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                self._parse_errors.append(stripped[:500].decode("utf-8", "replace"))
                 continue
             if isinstance(message, dict):
                 self._messages.put(message)
@@ -223,7 +228,7 @@ class AppServerClient:
     def _read_stderr(self) -> None:
         assert self.process.stderr is not None
         for line in self.process.stderr:
-            self._stderr.append(line.rstrip())
+            self._stderr.append(line.decode("utf-8", "replace").rstrip())
 
     def _send(self, message: Mapping[str, object]) -> None:
         if self.process.poll() is not None:
@@ -231,9 +236,9 @@ class AppServerClient:
                 f"Codex app-server exited with code {self.process.returncode}"
             )
         assert self.process.stdin is not None
-        encoded = json.dumps(message, ensure_ascii=False, separators=(",", ":"))
+        encoded = _JSONL_ENCODE(message)
         with self._write_lock:
-            self.process.stdin.write(encoded + "\n")
+            self.process.stdin.write(encoded.encode("utf-8") + b"\n")
             self.process.stdin.flush()
 
     def notify(self, method: str) -> None:
@@ -2082,7 +2087,9 @@ def main(argv: Sequence[str] | None = None) -> int:
     if args.baseline_report is not None:
         baseline_path = args.baseline_report.expanduser().resolve()
         try:
-            loaded_baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+            # json.loads handles UTF-8 (and BOM) bytes directly; skipping the
+            # Python-level decode matters for multi-MB baseline files.
+            loaded_baseline = json.loads(baseline_path.read_bytes())
         except (OSError, json.JSONDecodeError) as exc:
             print(
                 f"error: cannot read baseline report {baseline_path}: {exc}",
@@ -18,6 +18,13 @@ from typing import List
 BEGIN_TOC: str = "<!-- Begin ToC -->"
 END_TOC: str = "<!-- End ToC -->"
 
+# Compiled once at import; these run against every line/heading in the file.
+HEADING_RE = re.compile(r"^(#{2,6})\s+(.*)$")
+SLUG_PUNCTUATION_RE = re.compile(r"[^0-9a-z\s-]")
+
+# One indent string per heading level (## through ######).
+INDENTS = tuple("  " * i for i in range(5))
+
 
 def main() -> int:
     parser = argparse.ArgumentParser(
@@ -47,7 +54,7 @@ def generate_toc_lines(content: str) -> List[str]:
             continue
         if in_code:
             continue
-        m = re.match(r"^(#{2,6})\s+(.*)$", line)
+        m = HEADING_RE.match(line)
         if not m:
             continue
         level = len(m.group(1))
@@ -56,13 +63,13 @@ def generate_toc_lines(content: str) -> List[str]:
 
     toc = []
     for level, text in headings:
-        indent = "  " * (level - 2)
+        indent = INDENTS[level - 2]
         slug = text.lower()
         # normalize spaces and dashes
         slug = slug.replace("\u00a0", " ")
         slug = slug.replace("\u2011", "-").replace("\u2013", "-").replace("\u2014", "-")
         # drop other punctuation
-        slug = re.sub(r"[^0-9a-z\s-]", "", slug)
+        slug = SLUG_PUNCTUATION_RE.sub("", slug)
         slug = slug.strip().replace(" ", "-")
         toc.append(f"{indent}- [{text}](#{slug})")
     return toc
@@ -269,6 +269,12 @@ def list_workflow_artifacts(workflow_id: str) -> list[WorkflowArtifact]:
     return artifacts
 
 
+def _dir_has_entries(path: Path) -> bool:
+    # Short-circuits on the first entry instead of materializing the listing.
+    with os.scandir(path) as entries:
+        return next(entries, None) is not None
+
+
 def download_artifacts(
     workflow_id: str,
     dest_dir: Path,
@@ -281,7 +287,7 @@ def download_artifacts(
     )
     for artifact in artifacts:
         artifact_dir = dest_dir / artifact.name
-        if artifact_dir.is_dir() and any(artifact_dir.iterdir()):
+        if artifact_dir.is_dir() and _dir_has_entries(artifact_dir):
             print(
                 f"  using cached {artifact.name} ({format_bytes(artifact.size_in_bytes)})",
                 flush=True,